@@ -0,0 +1,98 @@
+"""camera 모듈의 깊이 맵 투영 및 리매핑 테스트."""
+
+import numpy as np
+import pytest
+
+from vision_toolbox.utils import camera as C
+
+
+@pytest.fixture(params=["jit", "numpy"])
+def scatter_backend(request, monkeypatch):
+    """numba 설치 여부와 관계없이 두 scatter 경로를 모두 검사."""
+    if request.param == "jit" and C.njit is None:
+        pytest.skip("numba is not installed")
+    if request.param == "numpy":
+        monkeypatch.setattr(C, "njit", None)
+    return request.param
+
+
+def test_depth_map_from_points_keeps_min_depth(scatter_backend):
+    _pts = np.array([
+        [1.0, 1.0, 1.0], [2.0, 2.0, 2.0], [1.5, 1.5, 3.0],
+        [4.0, 2.0, 2.0], [-1.0, 0.0, 1.0], [0.0, 0.0, -1.0],
+    ])
+    _expected = np.zeros((4, 4, 1), dtype=np.float32)
+    _expected[1, 1] = 1.0 # (1, 1)에 겹친 깊이 1, 2 중 최소값
+    _expected[0, 0] = 3.0
+    _expected[1, 2] = 2.0
+    np.testing.assert_array_equal(
+        C.Get_depth_map_from_points(_pts, (4, 4)), _expected)
+
+
+def test_depth_map_from_points_ignores_non_finite_depth(scatter_backend):
+    _pts = np.array([
+        [1.0, 1.0, np.inf], [2.0, 2.0, 1.0], [1.0, 2.0, np.nan]
+    ])
+    _expected = np.zeros((4, 4, 1), dtype=np.float32)
+    _expected[2, 2] = 1.0
+    np.testing.assert_array_equal(
+        C.Get_depth_map_from_points(_pts, (4, 4)), _expected)
+
+
+def _Pinhole(sz: tuple[int, int]) -> np.ndarray:
+    return C.Compose_intrinsic_matrix(
+        np.array([float(sz[0]), float(sz[0])]), np.array(sz) / 2)
+
+
+def test_remap_depth_map_keeps_min_depth_when_shrinking(scatter_backend):
+    _depth = np.full((8, 8, 1), 5.0, dtype=np.float32)
+    _depth[3, 2] = 1.0 # 배경 위의 가까운 물체
+    _remapper = C.Depth_Remapper(_Pinhole((8, 8)), (8, 8), (4, 4))
+
+    _new = _remapper(_depth)
+    _idx = _remapper.idx.reshape(8, 8)
+    _target = np.unravel_index(_idx[3, 2], (4, 4))
+    assert _new.shape == (4, 4, 1)
+    assert _new[_target] == 1.0
+    assert np.count_nonzero(_new == 1.0) == 1
+
+    # 모든 픽셀은 그 픽셀로 매핑되는 원본 깊이들의 최소값
+    for _flat in np.unique(_idx[_idx >= 0]):
+        _src = _depth[..., 0][_idx == _flat]
+        assert _new.ravel()[_flat] == _src.min()
+
+
+@pytest.mark.parametrize("new_sz", [(16, 12), (4, 12), (16, 3)])
+def test_remap_depth_map_upscale_fills_every_pixel(new_sz):
+    _depth = np.random.default_rng(0).uniform(1, 5, (6, 8, 1))
+    _new = C.Remap_depth_map(
+        _depth.astype(np.float32), _Pinhole((8, 6)), new_sz)
+    assert _new.shape == (new_sz[1], new_sz[0], 1)
+    assert np.all(_new[:-1, :-1] > 0)
+    assert np.isin(_new[_new > 0], _depth.astype(np.float32)).all()
+
+
+def test_depth_remapper_rejects_wrong_size():
+    _remapper = C.Depth_Remapper(_Pinhole((8, 8)), (8, 8), (4, 4))
+    with pytest.raises(ValueError):
+        _remapper(np.ones((6, 8, 1), dtype=np.float32))
+
+
+@pytest.mark.parametrize("new_sz", [(8, 8), (16, 16), (4, 4)])
+def test_remap_depth_map_zeroes_invalid_depth(new_sz):
+    _depth = np.full((8, 8, 1), 2.0, dtype=np.float32)
+    _depth[1, 1], _depth[2, 5], _depth[6, 3] = -1.0, np.nan, np.inf
+    _new = C.Remap_depth_map(_depth, _Pinhole((8, 8)), new_sz)
+    assert np.all(np.isfinite(_new))
+    assert np.all((_new == 0) | (_new == 2.0))
+
+
+def test_apply_intrinsic_transform_inverse_paths_agree():
+    _in_m = _Pinhole((640, 480))
+    _pts = np.random.default_rng(0).uniform(1, 5, (100, 3))
+    _proj = C.Apply_intrinsic_transform(_pts, _in_m)
+    np.testing.assert_allclose(
+        C.Apply_intrinsic_transform(_proj, _in_m, inv=True), _pts)
+    np.testing.assert_allclose(
+        C.Apply_intrinsic_transform(
+            _proj, _in_m, inv=True, in_m_inv=np.linalg.inv(_in_m)), _pts)
@@ -0,0 +1,126 @@
+"""geometry 모듈의 회전 변환 및 외부 파라미터 테스트."""
+
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+
+from vision_toolbox.utils import geometry as G
+
+
+def _Random_extrinsics(n: int, seed: int = 0) -> np.ndarray:
+    _ext = np.zeros((n, 4, 4))
+    _ext[:, :3, :3] = R.random(n, random_state=seed).as_matrix()
+    _ext[:, :3, 3] = np.random.default_rng(seed).normal(size=(n, 3))
+    _ext[:, 3, 3] = 1.0
+    return _ext
+
+
+# 180도 회전 및 항등 행렬 근처의 경계 사례 포함
+_SPECIAL_MATS = np.stack([
+    np.eye(3),
+    np.diag([1.0, -1.0, -1.0]),
+    np.diag([-1.0, 1.0, -1.0]),
+    np.diag([-1.0, -1.0, 1.0]),
+    R.from_rotvec([np.pi, 0.0, 0.0]).as_matrix(),
+    R.from_rotvec([1e-7, -2e-7, 3e-7]).as_matrix(),
+    R.from_rotvec([0.0, 1e-4, 0.0]).as_matrix(),
+])
+
+
+@pytest.mark.parametrize("pts_dim", [3, 4])
+def test_apply_extrinsic_identity(pts_dim):
+    _pts = np.random.default_rng(0).normal(size=(100, 3))
+    _in = G.To_homogeneous(_pts) if pts_dim == 4 else _pts
+    for _ext in [np.eye(4), np.eye(4)[None], np.tile(np.eye(4), (100, 1, 1))]:
+        for _inv in [False, True]:
+            _out = G.Apply_extrinsic_transform(_in, _ext, inv=_inv)
+            np.testing.assert_allclose(_out, _pts)
+
+
+def test_apply_extrinsic_matches_homogeneous_product():
+    _ext = _Random_extrinsics(50)
+    _pts = np.random.default_rng(1).normal(size=(50, 3))
+    _pts_h = G.To_homogeneous(_pts)
+
+    _single = np.einsum("ij,nj->ni", _ext[0], _pts_h)[:, :3]
+    np.testing.assert_allclose(
+        G.Apply_extrinsic_transform(_pts, _ext[0]), _single)
+
+    _paired = np.einsum("nij,nj->ni", _ext, _pts_h)[:, :3]
+    np.testing.assert_allclose(
+        G.Apply_extrinsic_transform(_pts, _ext), _paired)
+
+    _back = G.Apply_extrinsic_transform(_paired, _ext, inv=True)
+    np.testing.assert_allclose(_back, _pts, atol=1e-12)
+
+
+def test_invert_rigid_transform():
+    _ext = _Random_extrinsics(20)
+    np.testing.assert_allclose(
+        G._Invert_rigid_transform(_ext), np.linalg.inv(_ext), atol=1e-12)
+
+
+def test_matrix_to_quat_known_values():
+    _expected = np.array([
+        [0.0, 0.0, 0.0, 1.0], [1.0, 0.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0],
+    ])
+    np.testing.assert_allclose(
+        np.abs(G.From_matrix_to_quat(_SPECIAL_MATS[:4])), _expected,
+        atol=1e-12)
+    np.testing.assert_allclose(
+        G.From_matrix_to_rotvec(_SPECIAL_MATS[5]),
+        np.rad2deg([1e-7, -2e-7, 3e-7]), rtol=1e-6)
+
+
+def test_matrix_to_quat_orthonormalizes_input():
+    _rot = R.random(20, random_state=1)
+    _noisy = _rot.as_matrix() + np.random.default_rng(2).normal(
+        scale=1e-3, size=(20, 3, 3))
+    _quat = G.From_matrix_to_quat(2 * _rot.as_matrix())
+    np.testing.assert_allclose(
+        np.abs(np.sum(_quat * _rot.as_quat(), axis=1)), 1)
+
+    _u, _, _vt = np.linalg.svd(_noisy)
+    np.testing.assert_allclose(
+        G.From_matrix_to_rotvec(_noisy),
+        R.from_matrix(_u @ _vt).as_rotvec(degrees=True), atol=1e-9)
+
+
+def test_remove_duplicate_poses_keeps_first_occurrence_order():
+    _ext = _Random_extrinsics(10)
+    _data = np.concatenate([_ext, _ext[[3, 1, 7]]])
+    _poses, _indices = G.Remove_duplicate_poses(_data, 6)
+    np.testing.assert_array_equal(_indices, np.arange(10))
+    np.testing.assert_array_equal(_poses, _ext)
+
+
+@pytest.mark.parametrize("mat", [
+    np.diag([1.0, 1.0, -1.0]),
+    np.zeros((2, 3, 3)),
+    np.eye(4),
+    np.ones(3),
+])
+def test_matrix_to_quat_rejects_invalid_matrix(mat):
+    with pytest.raises(ValueError):
+        G.From_matrix_to_quat(mat)
+    with pytest.raises(ValueError):
+        G.From_matrix_to_rotvec(mat)
+
+
+@pytest.mark.parametrize("n", [4, 5])
+def test_change_handedness_points(n):
+    _pts = np.random.default_rng(3).normal(size=(n, 3))
+    _pts_h = G.To_homogeneous(_pts)
+    _expected = (_pts_h @ G.L_TO_R.T)[:, :3]
+    np.testing.assert_allclose(G.Change_handedness(_pts), _expected, rtol=1e-6)
+    np.testing.assert_allclose(
+        G.Change_handedness(_pts_h), _expected, rtol=1e-6)
+
+
+def test_change_handedness_poses():
+    _ext = _Random_extrinsics(3)
+    np.testing.assert_allclose(G.Change_handedness(_ext), G.L_TO_R @ _ext)
+    _single = G.Change_handedness(_ext[:1])
+    assert _single.shape == (1, 4, 4)
+    np.testing.assert_allclose(_single[0], G.L_TO_R @ _ext[0])
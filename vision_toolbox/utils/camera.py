@@ -1,6 +1,12 @@
 """카메라 모델 및 투영 계산을 위한 함수 모음."""
 
 import numpy as np
+import cv2
+
+try: # numba가 설치된 경우 깊이 기록(scatter) 루프를 JIT 컴파일하여 사용
+    from numba import njit
+except ImportError:
+    njit = None
 
 from ..vision_types import VEC_2D, IMG_SIZE, IN_M, VEC_3D, IMG_1C
 
@@ -9,7 +15,8 @@ __all__ = [
     "Get_principal_point", "Get_principal_point_rate",
     "Compose_intrinsic_matrix", "Extract_intrinsic_params",
     "Adjust_intrinsic_matrix", "Apply_intrinsic_transform",
-    "Get_points_from_depth", "Get_depth_map_from_points", "Remap_depth_map"
+    "Get_points_from_depth", "Get_depth_map_from_points", "Depth_Remapper",
+    "Remap_depth_map"
 ]
 
 
@@ -44,14 +51,13 @@ def Compose_intrinsic_matrix(f_len: VEC_2D, pp: VEC_2D) -> IN_M:
     """초점 거리와 주점으로부터 내부 파라미터 행렬을 구성합니다."""
     if f_len.ndim != pp.ndim or f_len.shape[0] != pp.shape[0]:
         raise ValueError("Dimensions of f_len and pp do not match.")
-    
-    _concat = np.concatenate([f_len, pp], axis=-1)
-    if pp.ndim >= 2:
-        _in_m = np.tile(np.eye(3), [pp.shape[0], 1, 1])
-        _in_m[:, [0, 1, 0, 1], [0, 1, 2, 2]] = _concat
-    else:
-        _in_m = np.eye(3)
-        _in_m[[0, 1, 0, 1], [0, 1, 2, 2]] = _concat
+
+    # 단일/배치 모두 0 행렬 하나를 만든 뒤 필요한 원소만 채움
+    _dtype = np.result_type(f_len, pp, np.float32)
+    _in_m = np.zeros(pp.shape[:-1] + (3, 3), dtype=_dtype)
+    _in_m[..., 0, 0], _in_m[..., 1, 1] = f_len[..., 0], f_len[..., 1]
+    _in_m[..., 0, 2], _in_m[..., 1, 2] = pp[..., 0], pp[..., 1]
+    _in_m[..., 2, 2] = 1.0
     return _in_m
 
 
@@ -75,55 +81,152 @@ def Adjust_intrinsic_matrix(in_m: IN_M, sz: IMG_SIZE, new_sz: IMG_SIZE) -> IN_M:
 
 
 def Apply_intrinsic_transform(
-    pts: VEC_3D, in_m: IN_M, inv: bool = False
+    pts: VEC_3D, in_m: IN_M, inv: bool = False, in_m_inv: IN_M | None = None
 ) -> VEC_3D:
-    """포인트에 내부 파라미터 변환(투영)을 적용합니다."""
-    _mat = np.linalg.inv(in_m) if inv else in_m
-    return (_mat @ pts.T).T
+    """포인트에 내부 파라미터 변환(투영)을 적용합니다.
+
+    inv=True일 때 미리 계산한 역행렬(in_m_inv)이 있으면 재사용하고,
+    없으면 역행렬을 만들지 않고 선형 방정식을 풉니다.
+    같은 내부 파라미터로 여러 포인트 묶음을 역투영할 때는
+    np.linalg.inv(in_m)를 한 번만 계산해 in_m_inv로 전달하세요.
+    """
+    _dtype = np.result_type(pts, np.float32) # 행렬을 포인트의 정밀도에 맞춤
+    if not inv:
+        return pts @ in_m.astype(_dtype, copy=False).T
+    if in_m_inv is not None:
+        return pts @ in_m_inv.astype(_dtype, copy=False).T
+    return np.linalg.solve(in_m.astype(_dtype, copy=False), pts.T).T
 
 
 def Get_points_from_depth(d_map: IMG_1C, mask: IMG_1C | None = None) -> VEC_3D:
     """깊이 맵으로부터 3D 포인트 클라우드를 생성합니다."""
     _h, _w = d_map.shape[:2]
-    if mask is not None:
-        _m = mask.squeeze()
+    _dtype = np.result_type(d_map, np.float32) # 정수 좌표로 인한 float64 승격 방지
+    _d_map = d_map.reshape(_h, _w).astype(_dtype, copy=False)
+    if mask is None: # 전체 픽셀: 좌표 격자 대신 행/열 벡터를 브로드캐스트
+        _pts = np.empty((_h, _w, 3), dtype=_dtype)
+        np.multiply(_d_map, np.arange(_w, dtype=_dtype), out=_pts[..., 0])
+        np.multiply(
+            _d_map, np.arange(_h, dtype=_dtype)[:, None], out=_pts[..., 1]
+        )
+        _pts[..., 2] = _d_map
+        return _pts.reshape(-1, 3)
+
+    _yy, _xx = np.nonzero(mask.reshape(_h, _w))
+    _pts = np.empty((_yy.size, 3), dtype=_dtype)
+    _pts[:, 2] = _d_map[_yy, _xx]
+    np.multiply(_xx, _pts[:, 2], out=_pts[:, 0])
+    np.multiply(_yy, _pts[:, 2], out=_pts[:, 1])
+    return _pts
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _Scatter_min_kernel(idx: np.ndarray, d: np.ndarray, d_flat: np.ndarray):
+        """d_flat[idx[i]] = min(d_flat[idx[i]], d[i]) 를 단일 루프로 수행.
+
+        d_flat의 0은 아직 기록되지 않은 픽셀을 의미합니다 (d > 0 가정).
+        """
+        for _i in range(idx.size):
+            _cur = d_flat[idx[_i]]
+            if _cur == 0 or d[_i] < _cur:
+                d_flat[idx[_i]] = d[_i]
+
+
+def _Scatter_min_depth(
+    idx: np.ndarray, d: np.ndarray, d_sz: tuple[int, int]
+) -> IMG_1C:
+    """평탄화된 픽셀 인덱스에 깊이를 기록하고, 겹치는 픽셀은 최소 깊이를 유지."""
+    _w, _h = d_sz
+    if njit is not None: # 빈 픽셀을 0으로 두고 기록하므로 후처리가 필요 없음
+        _d_flat = np.zeros(_h * _w, dtype=np.float32)
+        _Scatter_min_kernel(idx, d, _d_flat)
     else:
-        _m = np.ones((_h, _w), dtype=bool)
-    
-    _d = d_map[_m].squeeze()
-    _yy, _xx = np.meshgrid(np.arange(_h), np.arange(_w), indexing='ij')
-    return np.c_[_xx[_m] * _d, _yy[_m] * _d, _d]
+        _d_flat = np.full(_h * _w, np.inf, dtype=np.float32)
+        np.minimum.at(_d_flat, idx, d)
+        _d_flat[_d_flat == np.inf] = 0
+    return _d_flat.reshape(_h, _w, 1)
 
 
 def Get_depth_map_from_points(pts: VEC_3D, d_sz: tuple[int, int]) -> IMG_1C:
     """3D 포인트 클라우드로부터 깊이 맵을 생성합니다."""
-    _w, _h = d_sz
-    _vis_pts = pts[pts[:, 2] > 1e-6]
-    _proj_pts = _vis_pts.copy()
-    _proj_pts[:, :2] /= _proj_pts[:, 2][:, None]
-    
-    _u = np.round(_proj_pts[:, 0]).astype(np.int32)
-    _v = np.round(_proj_pts[:, 1]).astype(np.int32)
-    
+    _w, _h = int(d_sz[0]), int(d_sz[1])
+    _vis_pts = pts[np.isfinite(pts[:, 2]) & (pts[:, 2] > 1e-6)]
+    _d = _vis_pts[:, 2]
+    _uv = np.rint(_vis_pts[:, :2] / _d[:, None])
+
+    # 범위 검사를 정수 변환 전에 수행 (변환할 원소 수 감소, 오버플로 방지)
+    _u, _v = _uv[:, 0], _uv[:, 1]
     _m = (_u >= 0) & (_u < _w) & (_v >= 0) & (_v < _h)
-    _u, _v, _d = _u[_m], _v[_m], _vis_pts[_m, 2]
-    
-    _d_flat = np.full(_h * _w, np.inf, dtype=np.float32)
-    _sort_idx = np.argsort(-_d)
-    _v_w_u = _v * _w + _u
-    
-    np.minimum.at(_d_flat, _v_w_u[_sort_idx], _d[_sort_idx])
-    _d_flat[np.isinf(_d_flat)] = 0
-    return _d_flat.reshape(_h, _w, 1)
+    _uv = _uv[_m].astype(np.int32)
+    _idx = _uv[:, 1] * _w + _uv[:, 0] # int32 유지
+    return _Scatter_min_depth(_idx, _d[_m], (_w, _h))
+
+
+class Depth_Remapper:
+    """고정된 내부 파라미터와 크기 변경에 대한 깊이 맵 리매핑.
+
+    두 내부 파라미터의 마지막 행이 [0, 0, 1]이므로 픽셀 간 변환은
+    H = K_new @ K^-1 인 2D 아핀 변환이고 깊이 값은 그대로 유지됩니다.
+    두 축 모두 축소될 때는 여러 원본 픽셀이 한 픽셀에 겹치므로 원본 픽셀별
+    대상 인덱스를 미리 계산해 두고 최소 깊이를 기록하며, 한 축이라도 확대되는
+    경우에는 최근접 보간 변환을 적용합니다.
+    """
+    def __init__(
+        self, in_m: IN_M, sz: tuple[int, int], new_sz: tuple[int, int]
+    ):
+        self.sz = (int(sz[0]), int(sz[1]))
+        self.new_sz = (int(new_sz[0]), int(new_sz[1]))
+        self.new_in_m = Adjust_intrinsic_matrix(
+            in_m, np.array(self.sz), np.array(self.new_sz)
+        )
+        self.hom = (self.new_in_m @ np.linalg.inv(in_m))[:2]
+
+        # 한 축이라도 확대되면 정방향 기록에 구멍이 생기므로 두 축 모두
+        # 축소(또는 유지)될 때만 최소 깊이 기록 사용
+        self.idx: np.ndarray | None = None
+        _shrink = [_n <= _o for _n, _o in zip(self.new_sz, self.sz)]
+        if all(_shrink) and self.new_sz != self.sz:
+            self.idx = self._Get_target_index()
+
+    def _Get_target_index(self) -> np.ndarray:
+        """원본 픽셀별 대상 픽셀의 평탄화 인덱스. 범위 밖은 -1."""
+        _w, _h = self.sz
+        _new_w, _new_h = self.new_sz
+        _x, _y = np.arange(_w)[None, :], np.arange(_h)[:, None]
+        _hu, _hv = self.hom
+        _u = np.rint(_hu[0] * _x + _hu[1] * _y + _hu[2])
+        _v = np.rint(_hv[0] * _x + _hv[1] * _y + _hv[2])
+
+        _m = (_u >= 0) & (_u < _new_w) & (_v >= 0) & (_v < _new_h)
+        _idx = np.full((_h, _w), -1, dtype=np.int32)
+        _idx[_m] = (_v[_m] * _new_w + _u[_m]).astype(np.int32)
+        return _idx.ravel()
+
+    def __call__(self, depth: IMG_1C) -> IMG_1C:
+        _h, _w = depth.shape[:2]
+        if (_w, _h) != self.sz:
+            raise ValueError("Size of depth does not match the remapper.")
+
+        _d_map = depth.reshape(_h, _w).astype(np.float32, copy=False)
+        _valid = np.isfinite(_d_map) & (_d_map > 1e-6) # 유효하지 않은 깊이는 0
+        if self.idx is not None: # 축소: 겹치는 픽셀은 최소 깊이 유지
+            _m = (self.idx >= 0) & _valid.ravel()
+            return _Scatter_min_depth(
+                self.idx[_m], _d_map.ravel()[_m], self.new_sz)
+
+        _new_d = cv2.warpAffine(
+            np.where(_valid, _d_map, 0), self.hom, self.new_sz,
+            flags=cv2.INTER_NEAREST,
+            borderMode=cv2.BORDER_CONSTANT, borderValue=0
+        )
+        return _new_d[..., None]
 
 
 def Remap_depth_map(depth: IMG_1C, in_m: IN_M, new_sz: tuple[int, int]) -> IMG_1C:
-    """새로운 카메라 내부 파라미터에 맞게 깊이 맵을 리매핑합니다."""
+    """새로운 카메라 내부 파라미터에 맞게 깊이 맵을 리매핑합니다.
+
+    같은 설정으로 여러 프레임을 처리할 때는 Depth_Remapper를 재사용하세요.
+    """
     _h, _w = depth.shape[:2]
-    _new_in = Adjust_intrinsic_matrix(
-        in_m, np.array([_w, _h]), np.array(new_sz)
-    )
-    _pts_on_img = Get_points_from_depth(depth)
-    _pts_on_cam = Apply_intrinsic_transform(_pts_on_img, in_m, inv=True)
-    _new_pts_on_img = Apply_intrinsic_transform(_pts_on_cam, _new_in)
-    return Get_depth_map_from_points(_new_pts_on_img, new_sz)
\ No newline at end of file
+    return Depth_Remapper(in_m, (_w, _h), new_sz)(depth)
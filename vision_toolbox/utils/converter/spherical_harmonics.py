@@ -1,6 +1,6 @@
 """구면 조화(Spherical Harmonics) 관련 변환 함수 모음."""
 
-from numpy import (ndarray, uint8, ones, c_, newaxis)
+from numpy import (ndarray, uint8, full, stack, newaxis)
 from numpy.linalg import norm
 
 # SH (Spherical Harmonics) 계수 정의
@@ -32,7 +32,7 @@ def Get_sh_bias_from(norm_pts: ndarray, max_l: int) -> ndarray:
             "max_l은 0 이상이어야 하며 norm_pts는 (N, 3) 형태여야 합니다."
         )
 
-    _bias = [ones(norm_pts.shape[0]) * SH0]
+    _bias = [full(norm_pts.shape[0], SH0)]
 
     if max_l > 0:
         _x, _y, _z = norm_pts[:, 0], norm_pts[:, 1], norm_pts[:, 2]
@@ -71,7 +71,7 @@ def Get_sh_bias_from(norm_pts: ndarray, max_l: int) -> ndarray:
             SH4[3] * (_x2 * _x2y2t3 - _y2 * _x2y2t2)
         ])
 
-    return c_[*_bias]
+    return stack(_bias, axis=1)
 
 
 def Convert_to_rgb_from(pts: ndarray, sh_weight: ndarray, max_l: int):
@@ -19,7 +19,8 @@ __all__ = [
 L_TO_R = np.array([ # 좌표계 변환(Left-to-Right Handed) 상수
     [0.0, 1.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0],
     [-0.0, -0.0, -1.0, -0.0], [0.0, 0.0, 0.0, 1.0]
-])
+], dtype=np.float32)
+_L_TO_R_ROT, _L_TO_R_T = L_TO_R[:3, :3], L_TO_R[:3, 3]
 
 
 def Compute_3d_covariance(scales: VEC_3D, rot: VEC_4D) -> tuple[VEC_3D, VEC_3D]:
@@ -68,20 +69,28 @@ def From_rotvec_to_matrix(r_vec: VEC_3D) -> ROT_M:
 
 def To_homogeneous(pts: VEC_2D | VEC_3D) -> VEC_3D | VEC_4D:
     """포인트 -> 동차 좌표."""
-    _ones = np.ones((pts.shape[0], 1), dtype=pts.dtype)
-    return np.c_[pts, _ones]
+    _n, _k = pts.shape
+    _pts_h = np.empty((_n, _k + 1), dtype=pts.dtype)
+    _pts_h[:, :_k], _pts_h[:, _k] = pts, 1
+    return _pts_h
 
 
 def Change_handedness(
     obj: VEC_3D | VEC_4D | TF_M, mode: Literal["L2R", "R2L"] = "L2R"
 ):
-    """좌표계(Handedness) 변환."""
+    """좌표계(Handedness) 변환.
+
+    2차원 입력은 포인트, 3차원 입력은 변환 행렬 배치로 취급합니다.
+    단일 변환 행렬은 (1, 4, 4)로 전달하거나 L_TO_R @ tf 로 계산하세요.
+    """
     if mode != "L2R":
         raise NotImplementedError("R2L 모드는 아직 구현되지 않음.")
 
-    if obj.ndim == 2: # 포인트(VEC_3D, VEC_4D)인 경우
-        _pts_h = To_homogeneous(obj) if obj.shape[1] == 3 else obj
-        return (L_TO_R @ _pts_h.T).T[:, :3]
+    if obj.ndim == 2: # 포인트(VEC_3D, VEC_4D)인 경우: 동차 좌표 없이 R p + w t
+        _pts = obj[:, :3] @ _L_TO_R_ROT.T
+        if obj.shape[1] == 3:
+            return _pts + _L_TO_R_T
+        return _pts + obj[:, 3:] * _L_TO_R_T
 
     return L_TO_R @ obj # 변환 행렬(TF_M)인 경우
 
@@ -89,12 +98,12 @@ def Change_handedness(
 def Compose_extrinsic_matrix(q: VEC_4D, t: VEC_3D) -> TF_M:
     """쿼터니언과 이동 벡터로 외부 파라미터 행렬을 구성합니다."""
     _mat = From_quat_to_matrix(q)
-    if q.ndim >= 2:
-        _ext = np.tile(np.eye(4), [q.shape[0], 1, 1])
-        _ext[:, :3, :3], _ext[:, :3, 3] = _mat, t
-    else:
-        _ext = np.eye(4)
-        _ext[:3, :3], _ext[:3, 3] = _mat, t
+
+    # 단일/배치 모두 0 행렬 하나를 만든 뒤 회전, 이동, 마지막 1만 채움
+    _dtype = np.result_type(q, t, np.float32)
+    _ext = np.zeros(_mat.shape[:-2] + (4, 4), dtype=_dtype)
+    _ext[..., :3, :3], _ext[..., :3, 3] = _mat, t
+    _ext[..., 3, 3] = 1.0
     return _ext
 
 
@@ -108,11 +117,22 @@ def Extract_extrinsic_params(ext: TF_M) -> tuple[VEC_4D, VEC_3D]:
     return _q, _t
 
 
+def _Invert_rigid_transform(tfs: TF_M) -> TF_M:
+    """강체 변환 [R | t]의 역변환 [R^T | -R^T t]를 LU 분해 없이 계산."""
+    _rot_t = np.swapaxes(tfs[..., :3, :3], -1, -2)
+    _inv = np.zeros_like(tfs)
+    _inv[..., :3, :3] = _rot_t
+    _inv[..., :3, 3] = -np.einsum("...ij,...j->...i", _rot_t, tfs[..., :3, 3])
+    _inv[..., 3, 3] = 1
+    return _inv
+
+
 def Get_median_extrinsic(from_tfs: TF_M, to_tfs: TF_M) -> TF_M:
     """변환 행렬들 사이의 중간값에 해당하는 변환 행렬을 계산합니다."""
     assert len(from_tfs) == len(to_tfs)
-    _rel_tfs = to_tfs @ np.linalg.inv(from_tfs)
-    _tr = np.eye(4)
+    _rel_tfs = to_tfs @ _Invert_rigid_transform(from_tfs)
+    _tr = np.zeros((4, 4))
+    _tr[3, 3] = 1.0
     _r_vecs = R.from_matrix(_rel_tfs[:, :3, :3]).as_rotvec()
     _tr[:3, :3] = R.from_rotvec(_r_vecs.mean(axis=0)).as_matrix()
     _tr[:3, 3] = _rel_tfs[:, :3, 3].mean(axis=0)
@@ -122,12 +142,24 @@ def Get_median_extrinsic(from_tfs: TF_M, to_tfs: TF_M) -> TF_M:
 def Apply_extrinsic_transform(
     pts: VEC_3D | VEC_4D, ext: TF_M, inv: bool = False
 ) -> VEC_3D:
-    """포인트에 외부 파라미터 변환을 적용합니다."""
-    _ext = np.linalg.inv(ext) if inv else ext
-    _ext = _ext[..., :3, :]
-    _pts_h = To_homogeneous(pts) if pts.shape[-1] == 3 else pts
-    _transformed_pts = np.einsum("...ij,...j->...i", _ext, _pts_h)
-    return _transformed_pts
+    """포인트에 외부 파라미터 변환을 적용합니다.
+
+    inv=True일 때 ext는 강체 변환으로 보고 역행렬을 닫힌 형태로 계산합니다.
+    """
+    _ext = _Invert_rigid_transform(ext) if inv else ext
+    _ext = _ext.astype(np.result_type(pts, np.float32), copy=False)
+    if _ext.ndim == 3 and _ext.shape[0] == 1:
+        _ext = _ext[0]
+
+    # 동차 좌표를 만들지 않고 회전과 이동을 나누어 적용
+    _rot, _t = _ext[..., :3, :3], _ext[..., :3, 3]
+    if pts.shape[-1] == 4: # 동차 좌표 입력은 w 성분만큼 이동
+        _t = _t * pts[..., 3:]
+        pts = pts[..., :3]
+
+    if _rot.ndim == 2: # 단일 변환은 모든 포인트에 대해 행렬곱 한 번으로 처리
+        return pts @ _rot.T + _t
+    return np.einsum("...ij,...j->...i", _rot, pts) + _t
 
 
 def Remove_duplicate_poses(
@@ -137,5 +169,11 @@ def Remove_duplicate_poses(
     _scale: int = 10 ** precision
     _flat_data = data.reshape(data.shape[0], -1)
     _scaled = (_flat_data * _scale).round().astype(np.int64)
-    _, _indices = np.unique(_scaled, axis=0, return_index=True)
+
+    # 각 행을 하나의 바이트열 키로 보고 1차원 unique 수행 (다중 열 lexsort 회피)
+    _keys = _scaled.view(
+        np.dtype((np.void, _scaled.itemsize * _scaled.shape[1]))
+    ).ravel()
+    _, _indices = np.unique(_keys, return_index=True)
+    _indices.sort() # 입력 순서 유지
     return data[_indices], _indices
\ No newline at end of file
@@ -1,6 +1,6 @@
 """이미지 처리 연산을 위한 함수 모음."""
 
-from typing import Literal
+from typing import Literal, Callable
 import numpy as np
 import cv2
 
@@ -13,6 +13,13 @@ __all__ = [
 
 CROP_MODE = Literal["pad", "crop_n", "crop_f", "crop_c"]
 
+# 크롭 모드별로 남길 구간(slice)을 만드는 함수. 목록에 없는 모드는 중앙 크롭.
+_CROP_SLICE: dict[str, Callable[[int], slice]] = {
+    "crop_n": lambda gap: slice(None, -gap),
+    "crop_f": lambda gap: slice(gap, None),
+    "crop_c": lambda gap: slice(gap // 2, gap // 2 - gap),
+}
+
 
 def Get_new_shape(
     sz: tuple[int, int], 
@@ -46,16 +53,10 @@ def Adjust_size(
     """계산된 갭(gap)만큼 이미지에 패딩을 추가하거나 크롭합니다."""
     if gap == 0: return img
     
-    _abs_gap = abs(gap)
     if gap < 0:
-        if mode == "crop_n": 
-            return img[:, :-_abs_gap] if is_w_dim else img[:-_abs_gap, :]
-        if mode == "crop_f": 
-            return img[:, _abs_gap:] if is_w_dim else img[_abs_gap:, :]
-        
-        _st, _ed = _abs_gap // 2, _abs_gap - (_abs_gap // 2)
-        return img[:, _st:-_ed] if is_w_dim else img[_st:-_ed, :]
-    
+        _slice = _CROP_SLICE.get(mode, _CROP_SLICE["crop_c"])(-gap)
+        return img[:, _slice] if is_w_dim else img[_slice]
+
     _st, _ed = gap // 2, gap - (gap // 2)
     _pad_v = ((0, 0), (_st, _ed), (0, 0)) if is_w_dim else ((_st, _ed), (0, 0), (0, 0))
     _pad_dims = _pad_v[:img.ndim]
@@ -101,17 +102,26 @@ def Visualize_image(
         invalid_color = [0, 0, 0]
     
     _valid_mask = (img > 0) & np.isfinite(img)
-    _valid_pixels = img[_valid_mask]
-    
-    if v_min is None: 
-        _v_min = np.min(_valid_pixels) if len(_valid_pixels) > 0 else 0
-    if v_max is None: 
-        _v_max = np.max(_valid_pixels) if len(_valid_pixels) > 0 else 1
-    
-    _range = max(_v_max - _v_min, 1e-8)
-    _img_norm = np.clip((img - _v_min) / _range, 0, 1)
-    _img_u8 = (_img_norm * 255).astype(np.uint8)
-    
+    _mask_u8 = _valid_mask.view(np.uint8)
+
+    if v_min is None and v_max is None:
+        # 유효 픽셀의 최소/최대값 계산과 uint8 정규화를 OpenCV에서 한 번에 처리
+        _img_u8 = cv2.normalize(
+            img, None, 0, 255, cv2.NORM_MINMAX, cv2.CV_8U, _mask_u8
+        )
+    else:
+        _lo, _hi = 0, 1
+        if (v_min is None or v_max is None) and _valid_mask.any():
+            _lo, _hi, _, _ = cv2.minMaxLoc(img, _mask_u8)
+        _v_min = _lo if v_min is None else v_min
+        _v_max = _hi if v_max is None else v_max
+
+        # 스케일, 범위 제한(saturate), uint8 변환을 한 번의 순회로 처리
+        _scale = 255 / max(_v_max - _v_min, 1e-8)
+        _img_u8 = cv2.addWeighted(
+            img, _scale, img, 0, -_v_min * _scale, dtype=cv2.CV_8U
+        )
+
     _colored = cv2.applyColorMap(_img_u8.squeeze(), cmap)
     _colored[~_valid_mask.squeeze()] = invalid_color
     return _colored
\ No newline at end of file